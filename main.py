@@ -1,15 +1,20 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import edge_tts
 import asyncio
 import os
 import uuid
+import hashlib
+import re
+from collections import OrderedDict
+from contextlib import asynccontextmanager, AsyncExitStack
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict, Set
 import logging
 import aiofiles
+import aiohttp
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -20,7 +25,8 @@ app = FastAPI(
     description="Indonesian Text-to-Speech API using Microsoft Edge TTS",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -36,6 +42,10 @@ app.add_middleware(
 OUTPUT_DIR = str(os.getenv("OUTPUT_DIR", "./app/output"))
 MAX_TEXT_LENGTH = int(os.getenv("TTS_MAX_TEXT_LENGTH", "5000"))
 CLEANUP_INTERVAL = int(os.getenv("TTS_CLEANUP_INTERVAL", "3600"))
+CLEANUP_SWEEP_INTERVAL = int(os.getenv("TTS_CLEANUP_SWEEP_INTERVAL", str(max(60, CLEANUP_INTERVAL // 4))))
+BATCH_CONCURRENCY = int(os.getenv("TTS_BATCH_CONCURRENCY", "4"))
+CACHE_SIZE = int(os.getenv("TTS_CACHE_SIZE", "512"))
+TTS_CONCURRENCY = int(os.getenv("TTS_CONCURRENCY", "8"))
 
 # Ensure output directory exists
 os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -70,13 +80,51 @@ ENGLISH_VOICES = {
 
 ALL_VOICES = {**INDONESIAN_VOICES, **ENGLISH_VOICES}
 
+# Flat (language, voice_id) -> Edge TTS voice name lookup
+VOICE_NAMES = {
+    **{("indonesian", k): v["name"] for k, v in INDONESIAN_VOICES.items()},
+    **{("english", k): v["name"] for k, v in ENGLISH_VOICES.items()}
+}
+DEFAULT_VOICE_NAMES = {
+    "indonesian": INDONESIAN_VOICES["female"]["name"],
+    "english": ENGLISH_VOICES["female_us"]["name"]
+}
+
+# Content-addressed LRU cache: request key -> (audio_id, output_file, file_size)
+CACHE: "OrderedDict[str, Tuple[str, str, int]]" = OrderedDict()
+
+# audio_id -> absolute path of the generated file
+AUDIO_INDEX: Dict[str, str] = {}
+
+# Caps concurrent Edge TTS websockets; excess synthesis requests queue here
+TTS_SEM = asyncio.Semaphore(TTS_CONCURRENCY)
+TTS_STATE = {"active": 0, "queued": 0}
+
+# Cache key -> future resolving to the file size of an in-progress synthesis
+INFLIGHT: Dict[str, "asyncio.Future[int]"] = {}
+
+class SharedTCPConnector(aiohttp.TCPConnector):
+    """TCP connector that survives the per-call ClientSession edge-tts opens.
+    
+    edge-tts wraps the connector in a session that owns and closes it, so
+    close() is a no-op here and the real close happens in shutdown().
+    """
+    async def close(self):
+        pass
+    
+    async def shutdown(self):
+        await super().close()
+
+# Process-wide connector shared by all Edge TTS calls, created on startup
+TTS_CONNECTOR: Optional[SharedTCPConnector] = None
+
 # Pydantic models
 class TTSRequest(BaseModel):
     text: str
     voice: str = "female"
-    rate: str = "+0%"  # -50% to +100%
-    pitch: str = "+0Hz"  # -50Hz to +50Hz
-    volume: str = "+0%"  # -50% to +50%
+    rate: str = Field("+0%", pattern=r"^[+-]\d{1,3}%$")  # -50% to +100%
+    pitch: str = Field("+0Hz", pattern=r"^[+-]\d{1,3}Hz$")  # -50Hz to +50Hz
+    volume: str = Field("+0%", pattern=r"^[+-]\d{1,3}%$")  # -50% to +50%
     language: str = "indonesian"  # indonesian or english
     output_format: str = "wav"  # wav or mp3
 
@@ -107,36 +155,325 @@ class VoiceInfo(BaseModel):
     description: str
     language: str
 
+# Voice tables are static, so the /voices payload is built once at import time
+VOICES_CACHED = [
+    VoiceInfo(voice_id=voice_id, **voice_data, language="Indonesian")
+    for voice_id, voice_data in INDONESIAN_VOICES.items()
+] + [
+    VoiceInfo(voice_id=voice_id, **voice_data, language="English")
+    for voice_id, voice_data in ENGLISH_VOICES.items()
+]
+VOICES_JSON = [voice.model_dump() for voice in VOICES_CACHED]
+
+# Indonesian: ~120 words/minute, English (and anything else): ~150 words/minute
+WORDS_PER_MINUTE = {"indonesian": 120}
+DEFAULT_WORDS_PER_MINUTE = 150
+WORD_RE = re.compile(r"\S+")
+CACHE_KEY_RE = re.compile(r"[0-9a-f]{64}")
+
 # Utility functions
 def estimate_duration(text: str, language: str = "indonesian") -> float:
     """Estimate audio duration based on text length and language"""
-    word_count = len(text.split())
-    # Indonesian: ~120 words/minute, English: ~150 words/minute
-    words_per_minute = 120 if language.lower() == "indonesian" else 150
+    # Count words without materializing a list of tokens
+    word_count = sum(1 for _ in WORD_RE.finditer(text))
+    words_per_minute = WORDS_PER_MINUTE.get(language.lower(), DEFAULT_WORDS_PER_MINUTE)
     duration_minutes = word_count / words_per_minute
     return round(duration_minutes * 60, 2)
 
 def get_voice_name(voice: str, language: str) -> str:
     """Get the actual voice name for Edge TTS"""
-    if language.lower() == "english":
-        return ENGLISH_VOICES.get(voice, ENGLISH_VOICES["female_us"])["name"]
-    else:
-        return INDONESIAN_VOICES.get(voice, INDONESIAN_VOICES["female"])["name"]
+    lang = "english" if language.lower() == "english" else "indonesian"
+    return VOICE_NAMES.get((lang, voice), DEFAULT_VOICE_NAMES[lang])
+
+def validate_text(text: str):
+    """Reject empty or oversized text before contacting Edge TTS"""
+    if not text.strip():
+        raise HTTPException(status_code=400, detail="Text cannot be empty")
+    
+    if len(text) > MAX_TEXT_LENGTH:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Text too long (max {MAX_TEXT_LENGTH} characters)"
+        )
+
+def cache_key(text: str, voice_name: str, rate: str, pitch: str, volume: str, file_extension: str) -> str:
+    """Build a stable hash for identical synthesis requests"""
+    raw = f"{voice_name}|{rate}|{pitch}|{volume}|{file_extension}|{text}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def cache_get(key: str) -> Optional[Tuple[str, str, int]]:
+    """Return a cached entry if its audio file still exists, renewing its retention"""
+    entry = CACHE.get(key)
+    if entry is None:
+        return None
+    try:
+        # Touching bumps ctime, so the returned URL stays valid for a full CLEANUP_INTERVAL
+        os.utime(entry[1])
+    except FileNotFoundError:
+        CACHE.pop(key, None)
+        return None
+    CACHE.move_to_end(key)
+    return entry
+
+def cache_adopt_file(key: str, file_extension: str) -> Optional[Tuple[str, str, int]]:
+    """Cache an existing content-addressed file on disk, renewing its retention"""
+    output_file = os.path.abspath(os.path.join(OUTPUT_DIR, f"arsa_tts_{key}.{file_extension}"))
+    try:
+        os.utime(output_file)
+        file_size = os.path.getsize(output_file)
+    except FileNotFoundError:
+        return None
+    entry = (key, output_file, file_size)
+    cache_put(key, entry)
+    AUDIO_INDEX[key] = output_file
+    return entry
+
+def cache_put(key: str, entry: Tuple[str, str, int]):
+    """Insert an entry, evicting the least recently used one when full"""
+    CACHE[key] = entry
+    CACHE.move_to_end(key)
+    while len(CACHE) > CACHE_SIZE:
+        CACHE.popitem(last=False)
+
+def audio_id_from_filename(filename: str) -> str:
+    """Extract the audio ID, which is always the last underscore-separated part"""
+    return os.path.splitext(filename)[0].rsplit("_", 1)[-1]
+
+def index_audio_files():
+    """Populate AUDIO_INDEX and warm CACHE from the files already in the output directory"""
+    cached_files = []
+    with os.scandir(OUTPUT_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith(('.wav', '.mp3')):
+                continue
+            audio_id = audio_id_from_filename(entry.name)
+            file_path = os.path.abspath(entry.path)
+            AUDIO_INDEX[audio_id] = file_path
+            # Single TTS files are named after their content hash, so they map back to cache keys
+            if entry.name.startswith("arsa_tts_") and CACHE_KEY_RE.fullmatch(audio_id):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    # Swept by another worker's cleanup while this one was starting
+                    AUDIO_INDEX.pop(audio_id, None)
+                    continue
+                cached_files.append((st.st_mtime, audio_id, file_path, st.st_size))
+    
+    # Insert oldest first so the most recent files survive LRU eviction
+    for _, audio_id, file_path, file_size in sorted(cached_files):
+        cache_put(audio_id, (audio_id, file_path, file_size))
+
+def stat_file(file_path: str) -> Optional[os.stat_result]:
+    """Stat a file, returning None if it does not exist"""
+    try:
+        return os.stat(file_path)
+    except FileNotFoundError:
+        return None
+
+def _scan_for_audio_file(audio_id: str) -> Optional[Tuple[str, os.stat_result]]:
+    """Find a file whose audio ID matches exactly by scanning the output directory"""
+    with os.scandir(OUTPUT_DIR) as it:
+        for entry in it:
+            if entry.name.endswith(('.wav', '.mp3')) and audio_id_from_filename(entry.name) == audio_id:
+                try:
+                    return os.path.abspath(entry.path), entry.stat()
+                except FileNotFoundError:
+                    return None  # Removed by a concurrent sweep
+    return None
+
+async def find_audio_file(audio_id: str) -> Optional[Tuple[str, os.stat_result]]:
+    """Resolve an audio ID to its file path and stat, scanning the directory only on index misses"""
+    file_path = AUDIO_INDEX.get(audio_id)
+    if file_path is not None:
+        stat_result = stat_file(file_path)
+        if stat_result is not None:
+            return file_path, stat_result
+        AUDIO_INDEX.pop(audio_id, None)
+    
+    # Single TTS files are named after their audio ID
+    for file_extension in ("wav", "mp3"):
+        file_path = os.path.abspath(os.path.join(OUTPUT_DIR, f"arsa_tts_{audio_id}.{file_extension}"))
+        stat_result = stat_file(file_path)
+        if stat_result is not None:
+            AUDIO_INDEX[audio_id] = file_path
+            return file_path, stat_result
+    
+    # Fall back to a directory scan for batch files created outside this process,
+    # off the event loop since it is O(files)
+    found = await asyncio.to_thread(_scan_for_audio_file, audio_id)
+    if found is not None:
+        AUDIO_INDEX[audio_id] = found[0]
+    return found
+
+def _sync_cleanup() -> Tuple[List[str], Set[str]]:
+    """Remove expired audio files and abandoned partial writes.
+    
+    Returns the removed filenames and the paths of the audio files still on disk.
+    """
+    removed = []
+    remaining = set()
+    current_time = datetime.now().timestamp()
+    with os.scandir(OUTPUT_DIR) as it:
+        for entry in it:
+            # .part files left behind by a killed worker would otherwise never be removed
+            if not entry.name.endswith(('.wav', '.mp3', '.part')) or not entry.is_file():
+                continue
+            try:
+                file_age = current_time - entry.stat().st_ctime
+            except FileNotFoundError:
+                continue  # Already removed by another worker
+            if file_age > CLEANUP_INTERVAL:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    continue  # Already removed by another worker
+                removed.append(entry.name)
+            elif not entry.name.endswith('.part'):
+                remaining.add(os.path.abspath(entry.path))
+    return removed, remaining
 
 async def cleanup_old_files():
     """Clean up audio files older than cleanup interval"""
     try:
-        current_time = datetime.now().timestamp()
-        for filename in os.listdir(OUTPUT_DIR):
-            file_path = os.path.join(OUTPUT_DIR, filename)
-            if os.path.isfile(file_path) and filename.endswith(('.wav', '.mp3')):
-                file_age = current_time - os.path.getctime(file_path)
-                if file_age > CLEANUP_INTERVAL:
-                    os.remove(file_path)
-                    logger.info(f"Cleaned up old file: {filename}")
+        # Entries added while the sweep runs are not in the snapshot and are kept
+        indexed = dict(AUDIO_INDEX)
+        
+        # Directory sweeps can be slow, keep them off the event loop
+        removed, remaining = await asyncio.to_thread(_sync_cleanup)
+        for filename in removed:
+            logger.info(f"Cleaned up old file: {filename}")
+        
+        # Drop index entries for files removed by this or any other worker
+        for audio_id, file_path in indexed.items():
+            if file_path not in remaining and AUDIO_INDEX.get(audio_id) == file_path:
+                del AUDIO_INDEX[audio_id]
     except Exception as e:
         logger.error(f"Error cleaning up files: {e}")
 
+def _compute_stats() -> Tuple[int, int]:
+    """Count audio files and their total size in a single directory pass"""
+    file_count = 0
+    total_size = 0
+    if os.path.exists(OUTPUT_DIR):
+        with os.scandir(OUTPUT_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(('.wav', '.mp3')):
+                    try:
+                        file_size = entry.stat().st_size
+                    except FileNotFoundError:
+                        continue  # Removed by a concurrent sweep
+                    file_count += 1
+                    total_size += file_size
+    return file_count, total_size
+
+async def _cleanup_loop():
+    """Sweep expired files periodically instead of after every request"""
+    while True:
+        await cleanup_old_files()
+        await asyncio.sleep(CLEANUP_SWEEP_INTERVAL)
+
+@app.on_event("startup")
+async def startup():
+    global TTS_CONNECTOR
+    TTS_CONNECTOR = SharedTCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=75)
+    index_audio_files()
+    logger.info(f"Indexed {len(AUDIO_INDEX)} existing audio files, {len(CACHE)} restored to cache")
+    app.state.cleanup_task = asyncio.create_task(_cleanup_loop())
+
+@app.on_event("shutdown")
+async def shutdown():
+    global TTS_CONNECTOR
+    cleanup_task = getattr(app.state, "cleanup_task", None)
+    if cleanup_task is not None:
+        cleanup_task.cancel()
+        try:
+            await cleanup_task
+        except asyncio.CancelledError:
+            pass
+    if TTS_CONNECTOR is not None:
+        await TTS_CONNECTOR.shutdown()
+        TTS_CONNECTOR = None
+
+class ClosingStreamingResponse(StreamingResponse):
+    """StreamingResponse that runs a cleanup callback however the response ends"""
+    def __init__(self, content, on_close, **kwargs):
+        super().__init__(content, **kwargs)
+        self.on_close = on_close
+    
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.on_close()
+
+async def _next_audio_chunk(stream) -> Optional[bytes]:
+    """Return the next audio payload from an edge-tts stream, or None when it ends"""
+    async for chunk in stream:
+        if chunk["type"] == "audio":
+            return chunk["data"]
+    return None
+
+@asynccontextmanager
+async def tts_slot():
+    """Hold one of the TTS_CONCURRENCY synthesis slots"""
+    TTS_STATE["queued"] += 1
+    try:
+        await TTS_SEM.acquire()
+    finally:
+        TTS_STATE["queued"] -= 1
+    TTS_STATE["active"] += 1
+    try:
+        yield
+    finally:
+        TTS_STATE["active"] -= 1
+        TTS_SEM.release()
+
+async def save_audio(communicate: edge_tts.Communicate, output_file: str):
+    """Stream synthesized audio to disk without blocking the event loop"""
+    # Write to a unique temporary name so partially written files are never served,
+    # and concurrent writers of the same content-addressed file never share an inode
+    partial_file = f"{output_file}.{uuid.uuid4().hex}.part"
+    try:
+        async with tts_slot(), aiofiles.open(partial_file, "wb") as f:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    await f.write(chunk["data"])
+        os.replace(partial_file, output_file)
+    except BaseException:
+        if os.path.exists(partial_file):
+            os.remove(partial_file)
+        raise
+
+async def synthesize_file(request: TTSRequest, voice_name: str, audio_id: str, file_extension: str) -> int:
+    """Synthesize a /tts request to its content-addressed file and return the file size"""
+    filename = f"arsa_tts_{audio_id}.{file_extension}"
+    output_file = os.path.join(OUTPUT_DIR, filename)
+    
+    # Create TTS communicate object
+    communicate = edge_tts.Communicate(
+        text=request.text,
+        voice=voice_name,
+        rate=request.rate,
+        pitch=request.pitch,
+        volume=request.volume,
+        connector=TTS_CONNECTOR
+    )
+    
+    # Generate and save audio
+    await save_audio(communicate, output_file)
+    
+    # Verify file was created
+    if not os.path.exists(output_file):
+        raise HTTPException(status_code=500, detail="Failed to generate audio file")
+    
+    # Get file size
+    file_size = os.path.getsize(output_file)
+    
+    cache_put(audio_id, (audio_id, output_file, file_size))
+    AUDIO_INDEX[audio_id] = os.path.abspath(output_file)
+    
+    return file_size
+
 # API Routes
 @app.get("/")
 async def root():
@@ -147,6 +484,7 @@ async def root():
         "supported_languages": ["Indonesian", "English"],
         "endpoints": {
             "tts": "/tts - Generate speech",
+            "tts_stream": "/tts/stream - Stream speech as it is generated",
             "voices": "/voices - List available voices",
             "health": "/health - Health check",
             "stats": "/stats - Service statistics",
@@ -162,86 +500,73 @@ async def health_check():
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "service": "edge-tts-api",
-        "output_dir_writable": os.access(OUTPUT_DIR, os.W_OK)
+        "output_dir_writable": await asyncio.to_thread(os.access, OUTPUT_DIR, os.W_OK)
     }
 
 @app.get("/voices", response_model=List[VoiceInfo])
 async def list_voices():
     """List all available voices"""
-    voices = []
-    
-    # Indonesian voices
-    for voice_id, voice_data in INDONESIAN_VOICES.items():
-        voices.append(VoiceInfo(
-            voice_id=voice_id,
-            name=voice_data["name"],
-            gender=voice_data["gender"],
-            description=voice_data["description"],
-            language="Indonesian"
-        ))
-    
-    # English voices
-    for voice_id, voice_data in ENGLISH_VOICES.items():
-        voices.append(VoiceInfo(
-            voice_id=voice_id,
-            name=voice_data["name"], 
-            gender=voice_data["gender"],
-            description=voice_data["description"],
-            language="English"
-        ))
-    
-    return voices
+    return ORJSONResponse(
+        content=VOICES_JSON,
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
 
 @app.post("/tts", response_model=TTSResponse)
-async def generate_speech(request: TTSRequest, background_tasks: BackgroundTasks):
+async def generate_speech(request: TTSRequest):
     """Generate speech from text"""
     try:
         # Validate input
-        if not request.text.strip():
-            raise HTTPException(status_code=400, detail="Text cannot be empty")
-        
-        if len(request.text) > MAX_TEXT_LENGTH:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Text too long (max {MAX_TEXT_LENGTH} characters)"
-            )
+        validate_text(request.text)
         
         # Get voice name
         voice_name = get_voice_name(request.voice, request.language)
         
-        # Generate unique ID for this audio
-        audio_id = str(uuid.uuid4())
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
         # Determine file extension
         file_extension = "wav" if request.output_format.lower() == "wav" else "mp3"
-        filename = f"arsa_tts_{timestamp}_{audio_id}.{file_extension}"
-        output_file = os.path.join(OUTPUT_DIR, filename)
         
-        # Create TTS communicate object
-        communicate = edge_tts.Communicate(
-            text=request.text,
-            voice=voice_name,
-            rate=request.rate,
-            pitch=request.pitch,
-            volume=request.volume
+        # Identical requests map to the same content hash, used as the audio ID
+        audio_id = cache_key(
+            request.text, voice_name, request.rate, request.pitch, request.volume, file_extension
         )
-        
-        # Generate and save audio
-        await communicate.save(output_file)
-        
-        # Verify file was created
-        if not os.path.exists(output_file):
-            raise HTTPException(status_code=500, detail="Failed to generate audio file")
-        
-        # Get file size
-        file_size = os.path.getsize(output_file)
-        
-        # Estimate duration
         duration = estimate_duration(request.text, request.language)
         
-        # Schedule cleanup
-        background_tasks.add_task(cleanup_old_files)
+        cached = cache_get(audio_id)
+        if cached is None:
+            # Another worker (or an evicted entry) may already have produced this file
+            cached = cache_adopt_file(audio_id, file_extension)
+        if cached is not None:
+            logger.info(f"Cache hit for audio: {audio_id}")
+            return TTSResponse(
+                success=True,
+                message="Audio retrieved from cache",
+                audio_id=audio_id,
+                audio_url=f"/audio/{audio_id}",
+                duration_estimate=duration,
+                voice_used=voice_name,
+                file_size=cached[2]
+            )
+        
+        # Coalesce concurrent identical requests onto a single synthesis
+        inflight = INFLIGHT.get(audio_id)
+        if inflight is not None:
+            logger.info(f"Joining in-flight synthesis for audio: {audio_id}")
+            file_size = await asyncio.shield(inflight)
+        else:
+            fut = asyncio.get_running_loop().create_future()
+            INFLIGHT[audio_id] = fut
+            try:
+                file_size = await synthesize_file(request, voice_name, audio_id, file_extension)
+                fut.set_result(file_size)
+            except Exception as e:
+                fut.set_exception(e)
+                fut.exception()  # Mark as retrieved when nobody else is waiting
+                raise
+            finally:
+                INFLIGHT.pop(audio_id, None)
+                if not fut.done():
+                    # Leader was cancelled; fail followers with a normal error, not CancelledError
+                    fut.set_exception(RuntimeError("Synthesis was cancelled"))
+                    fut.exception()
         
         logger.info(f"Generated audio: {audio_id} for voice: {voice_name}, size: {file_size} bytes")
         
@@ -261,23 +586,79 @@ async def generate_speech(request: TTSRequest, background_tasks: BackgroundTasks
         logger.error(f"TTS generation error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to generate speech: {str(e)}")
 
+@app.post("/tts/stream")
+async def stream_speech(request: TTSRequest):
+    """Stream generated speech directly to the client"""
+    validate_text(request.text)
+    
+    voice_name = get_voice_name(request.voice, request.language)
+    
+    communicate = edge_tts.Communicate(
+        text=request.text,
+        voice=voice_name,
+        rate=request.rate,
+        pitch=request.pitch,
+        volume=request.volume,
+        connector=TTS_CONNECTOR
+    )
+    
+    # Take a slot and wait for the first audio chunk before sending headers,
+    # so upstream failures surface as a 500 instead of an empty 200 body
+    resources = AsyncExitStack()
+    try:
+        await resources.enter_async_context(tts_slot())
+        stream = communicate.stream()
+        resources.push_async_callback(stream.aclose)
+        first_chunk = await _next_audio_chunk(stream)
+        if first_chunk is None:
+            raise edge_tts.exceptions.NoAudioReceived("No audio was received")
+    except Exception as e:
+        await resources.aclose()
+        logger.error(f"TTS streaming error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to generate speech: {str(e)}")
+    except BaseException:
+        await resources.aclose()
+        raise
+    
+    async def _gen():
+        try:
+            yield first_chunk
+            while (chunk := await _next_audio_chunk(stream)) is not None:
+                yield chunk
+        except Exception as e:
+            logger.error(f"TTS streaming error: {str(e)}")
+            raise
+    
+    logger.info(f"Streaming audio for voice: {voice_name}")
+    
+    # Edge TTS always emits MP3 frames
+    return ClosingStreamingResponse(
+        _gen(),
+        on_close=resources.aclose,
+        media_type="audio/mpeg",
+        headers={"X-Voice-Used": voice_name}
+    )
+
 @app.get("/audio/{audio_id}")
 async def download_audio(audio_id: str):
     """Download generated audio file"""
     try:
-        # Find file with this audio_id in the filename
-        for filename in os.listdir(OUTPUT_DIR):
-            if audio_id in filename and filename.endswith(('.wav', '.mp3')):
-                file_path = os.path.join(OUTPUT_DIR, filename)
-                if os.path.exists(file_path):
-                    # Determine media type
-                    media_type = "audio/wav" if filename.endswith('.wav') else "audio/mpeg"
-                    
-                    return FileResponse(
-                        file_path,
-                        media_type=media_type,
-                        filename=f"arsa_tts_{audio_id}.{'wav' if filename.endswith('.wav') else 'mp3'}"
-                    )
+        found = await find_audio_file(audio_id)
+        if found is not None:
+            file_path, stat_result = found
+            
+            # Determine media type
+            is_wav = file_path.endswith('.wav')
+            media_type = "audio/wav" if is_wav else "audio/mpeg"
+            
+            # Passing the stat result avoids a second stat and sets Content-Length/ETag
+            return FileResponse(
+                file_path,
+                media_type=media_type,
+                filename=f"arsa_tts_{audio_id}.{'wav' if is_wav else 'mp3'}",
+                stat_result=stat_result,
+                headers={"Accept-Ranges": "bytes", "Cache-Control": "public, max-age=86400"}
+            )
         
         raise HTTPException(status_code=404, detail="Audio file not found")
         
@@ -288,23 +669,22 @@ async def download_audio(audio_id: str):
         raise HTTPException(status_code=500, detail="Failed to download audio")
 
 @app.post("/tts/batch")
-async def generate_batch_speech(requests: List[TTSRequest], background_tasks: BackgroundTasks):
+async def generate_batch_speech(requests: List[TTSRequest]):
     """Generate multiple speech files in batch"""
     try:
         if len(requests) > 10:
             raise HTTPException(status_code=400, detail="Maximum 10 requests per batch")
         
-        results = []
+        sem = asyncio.Semaphore(BATCH_CONCURRENCY)
         
-        for i, req in enumerate(requests):
-            try:
+        async def _one(i: int, req: TTSRequest) -> dict:
+            async with sem:
                 # Generate speech for each request
                 voice_name = get_voice_name(req.voice, req.language)
                 audio_id = str(uuid.uuid4())
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 
                 file_extension = "wav" if req.output_format.lower() == "wav" else "mp3"
-                filename = f"arsa_batch_{timestamp}_{i}_{audio_id}.{file_extension}"
+                filename = f"arsa_batch_{i}_{audio_id}.{file_extension}"
                 output_file = os.path.join(OUTPUT_DIR, filename)
                 
                 communicate = edge_tts.Communicate(
@@ -312,15 +692,17 @@ async def generate_batch_speech(requests: List[TTSRequest], background_tasks: Ba
                     voice=voice_name,
                     rate=req.rate,
                     pitch=req.pitch,
-                    volume=req.volume
+                    volume=req.volume,
+                    connector=TTS_CONNECTOR
                 )
                 
-                await communicate.save(output_file)
+                await save_audio(communicate, output_file)
+                AUDIO_INDEX[audio_id] = os.path.abspath(output_file)
                 
                 file_size = os.path.getsize(output_file) if os.path.exists(output_file) else 0
                 duration = estimate_duration(req.text, req.language)
                 
-                results.append({
+                return {
                     "success": True,
                     "audio_id": audio_id,
                     "audio_url": f"/audio/{audio_id}",
@@ -328,16 +710,24 @@ async def generate_batch_speech(requests: List[TTSRequest], background_tasks: Ba
                     "voice_used": voice_name,
                     "file_size": file_size,
                     "text_preview": req.text[:50] + "..." if len(req.text) > 50 else req.text
-                })
-                
-            except Exception as e:
+                }
+        
+        # Run batch items concurrently; failures are reported per item
+        outcomes = await asyncio.gather(
+            *[_one(i, req) for i, req in enumerate(requests)],
+            return_exceptions=True
+        )
+        
+        results = []
+        for req, outcome in zip(requests, outcomes):
+            if isinstance(outcome, Exception):
                 results.append({
                     "success": False,
-                    "error": str(e),
+                    "error": str(outcome),
                     "text_preview": req.text[:50] + "..." if len(req.text) > 50 else req.text
                 })
-        
-        background_tasks.add_task(cleanup_old_files)
+            else:
+                results.append(outcome)
         
         return {
             "batch_success": True,
@@ -357,24 +747,18 @@ async def generate_batch_speech(requests: List[TTSRequest], background_tasks: Ba
 async def get_stats():
     """Get service statistics"""
     try:
-        # Count files in output directory
-        files = os.listdir(OUTPUT_DIR) if os.path.exists(OUTPUT_DIR) else []
-        audio_files = [f for f in files if f.endswith(('.wav', '.mp3'))]
-        
-        # Calculate total size
-        total_size = 0
-        for f in audio_files:
-            file_path = os.path.join(OUTPUT_DIR, f)
-            if os.path.exists(file_path):
-                total_size += os.path.getsize(file_path)
+        file_count, total_size = await asyncio.to_thread(_compute_stats)
         
         return {
-            "total_audio_files": len(audio_files),
+            "total_audio_files": file_count,
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
             "available_voices": len(ALL_VOICES),
             "supported_languages": ["Indonesian", "English"],
             "max_text_length": MAX_TEXT_LENGTH,
+            "tts_concurrency": TTS_CONCURRENCY,
+            "tts_active": TTS_STATE["active"],
+            "tts_queued": TTS_STATE["queued"],
             "cleanup_interval_hours": CLEANUP_INTERVAL / 3600,
             "output_directory": OUTPUT_DIR
         }
@@ -385,4 +769,15 @@ async def get_stats():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8021)
\ No newline at end of file
+    # Each worker keeps its own cache and index; on a miss both fall back to
+    # the shared output directory, so files written by other workers are reused.
+    # "auto" picks uvloop/httptools (uvicorn[standard]) and degrades on Windows.
+    workers = int(os.getenv("WEB_CONCURRENCY", str(min(4, os.cpu_count() or 1))))
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8021,
+        workers=workers,
+        loop="auto",
+        http="auto"
+    )
\ No newline at end of file
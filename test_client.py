@@ -4,11 +4,10 @@ Test client for ARSA Technology Edge-TTS API
 Usage: python test_client.py [SERVER_IP]
 """
 
-import requests
+import asyncio
+import httpx
 import json
 import sys
-import time
-from pathlib import Path
 
 def get_api_base():
     """Get API base URL from command line or prompt"""
@@ -21,40 +20,48 @@ def get_api_base():
     
     return f"http://{server_ip}:8021"
 
-def test_health(api_base):
+async def download_audio(client, audio_url, filename):
+    """Stream an audio file to disk chunk by chunk"""
+    async with client.stream("GET", audio_url, timeout=30) as r:
+        r.raise_for_status()
+        with open(filename, "wb") as f:
+            async for chunk in r.aiter_bytes(chunk_size=64 * 1024):
+                f.write(chunk)
+
+async def test_health(client, log):
     """Test API health"""
     try:
-        print("🔍 Testing health check...")
-        response = requests.get(f"{api_base}/health", timeout=10)
+        log("🔍 Testing health check...")
+        response = await client.get("/health", timeout=10)
         response.raise_for_status()
         result = response.json()
-        print(f"✅ Health: {result['status']} - {result['timestamp']}")
+        log(f"✅ Health: {result['status']} - {result['timestamp']}")
         return True
     except Exception as e:
-        print(f"❌ Health check failed: {e}")
+        log(f"❌ Health check failed: {e}")
         return False
 
-def test_voices(api_base):
+async def test_voices(client, log):
     """Test voice listing"""
     try:
-        print("🎤 Testing voice listing...")
-        response = requests.get(f"{api_base}/voices", timeout=10)
+        log("🎤 Testing voice listing...")
+        response = await client.get("/voices", timeout=10)
         response.raise_for_status()
         voices = response.json()
         
-        print("✅ Available voices:")
+        log("✅ Available voices:")
         for voice in voices:
-            print(f"   {voice['voice_id']}: {voice['description']} ({voice['language']})")
+            log(f"   {voice['voice_id']}: {voice['description']} ({voice['language']})")
         
         return True
     except Exception as e:
-        print(f"❌ Voice listing failed: {e}")
+        log(f"❌ Voice listing failed: {e}")
         return False
 
-def test_indonesian_tts(api_base):
+async def test_indonesian_tts(client, log):
     """Test Indonesian TTS generation"""
     try:
-        print("🇮🇩 Testing Indonesian TTS...")
+        log("🇮🇩 Testing Indonesian TTS...")
         
         request_data = {
             "text": "Selamat datang di Arsa Technology. Kami adalah perusahaan A I dan IoT terdepan di Indonesia yang menghadirkan solusi teknologi canggih dengan akurasi tinggi untuk transformasi digital bisnis Anda.",
@@ -65,41 +72,38 @@ def test_indonesian_tts(api_base):
             "output_format": "wav"
         }
         
-        print("   Generating speech...")
-        response = requests.post(f"{api_base}/tts", json=request_data, timeout=30)
+        log("   Generating speech...")
+        response = await client.post("/tts", json=request_data, timeout=30)
         response.raise_for_status()
         result = response.json()
         
         if result["success"]:
-            print(f"✅ Indonesian TTS generated:")
-            print(f"   Audio ID: {result['audio_id']}")
-            print(f"   Duration: {result['duration_estimate']}s")
-            print(f"   Voice: {result['voice_used']}")
-            print(f"   File size: {result['file_size']} bytes")
+            log(f"✅ Indonesian TTS generated:")
+            log(f"   Audio ID: {result['audio_id']}")
+            log(f"   Duration: {result['duration_estimate']}s")
+            log(f"   Voice: {result['voice_used']}")
+            log(f"   File size: {result['file_size']} bytes")
             
             # Download the audio file
-            print("   Downloading audio...")
-            audio_url = f"{api_base}{result['audio_url']}"
-            audio_response = requests.get(audio_url, timeout=30)
-            audio_response.raise_for_status()
-            
+            log("   Downloading audio...")
+            audio_url = result['audio_url']
             filename = f"test_indonesian_{result['audio_id']}.wav"
-            Path(filename).write_bytes(audio_response.content)
-            print(f"💾 Audio saved as: {filename}")
+            await download_audio(client, audio_url, filename)
+            log(f"💾 Audio saved as: {filename}")
             
             return True
         else:
-            print(f"❌ TTS failed: {result}")
+            log(f"❌ TTS failed: {result}")
             return False
             
     except Exception as e:
-        print(f"❌ Indonesian TTS failed: {e}")
+        log(f"❌ Indonesian TTS failed: {e}")
         return False
 
-def test_english_tts(api_base):
+async def test_english_tts(client, log):
     """Test English TTS generation"""
     try:
-        print("🇺🇸 Testing English TTS...")
+        log("🇺🇸 Testing English TTS...")
         
         request_data = {
             "text": "Welcome to Arsa Technology. We are Indonesia's leading AI and IoT company, providing cutting-edge technology solutions with 99.67% accuracy in face recognition and comprehensive IoT monitoring systems.",
@@ -109,39 +113,36 @@ def test_english_tts(api_base):
             "output_format": "wav"
         }
         
-        print("   Generating speech...")
-        response = requests.post(f"{api_base}/tts", json=request_data, timeout=30)
+        log("   Generating speech...")
+        response = await client.post("/tts", json=request_data, timeout=30)
         response.raise_for_status()
         result = response.json()
         
         if result["success"]:
-            print(f"✅ English TTS generated:")
-            print(f"   Audio ID: {result['audio_id']}")
-            print(f"   Duration: {result['duration_estimate']}s")
-            print(f"   Voice: {result['voice_used']}")
+            log(f"✅ English TTS generated:")
+            log(f"   Audio ID: {result['audio_id']}")
+            log(f"   Duration: {result['duration_estimate']}s")
+            log(f"   Voice: {result['voice_used']}")
             
             # Download the audio file
-            audio_url = f"{api_base}{result['audio_url']}"
-            audio_response = requests.get(audio_url, timeout=30)
-            audio_response.raise_for_status()
-            
+            audio_url = result['audio_url']
             filename = f"test_english_{result['audio_id']}.wav"
-            Path(filename).write_bytes(audio_response.content)
-            print(f"💾 Audio saved as: {filename}")
+            await download_audio(client, audio_url, filename)
+            log(f"💾 Audio saved as: {filename}")
             
             return True
         else:
-            print(f"❌ English TTS failed: {result}")
+            log(f"❌ English TTS failed: {result}")
             return False
             
     except Exception as e:
-        print(f"❌ English TTS failed: {e}")
+        log(f"❌ English TTS failed: {e}")
         return False
 
-def test_batch_tts(api_base):
+async def test_batch_tts(client, log):
     """Test batch TTS generation"""
     try:
-        print("📦 Testing batch TTS...")
+        log("📦 Testing batch TTS...")
         
         batch_requests = [
             {
@@ -161,52 +162,78 @@ def test_batch_tts(api_base):
             }
         ]
         
-        print("   Processing batch...")
-        response = requests.post(f"{api_base}/tts/batch", json=batch_requests, timeout=60)
+        log("   Processing batch...")
+        response = await client.post("/tts/batch", json=batch_requests, timeout=60)
         response.raise_for_status()
         result = response.json()
         
         if result["batch_success"]:
-            print(f"✅ Batch TTS completed:")
-            print(f"   Total requests: {result['total_requests']}")
-            print(f"   Successful: {result['successful']}")
-            print(f"   Failed: {result['failed']}")
+            log(f"✅ Batch TTS completed:")
+            log(f"   Total requests: {result['total_requests']}")
+            log(f"   Successful: {result['successful']}")
+            log(f"   Failed: {result['failed']}")
             
             for i, res in enumerate(result['results']):
                 if res.get('success'):
-                    print(f"   {i+1}. ✅ {res['text_preview']}")
+                    log(f"   {i+1}. ✅ {res['text_preview']}")
                 else:
-                    print(f"   {i+1}. ❌ {res['text_preview']} - {res.get('error', 'Unknown error')}")
+                    log(f"   {i+1}. ❌ {res['text_preview']} - {res.get('error', 'Unknown error')}")
             
             return True
         else:
-            print(f"❌ Batch TTS failed: {result}")
+            log(f"❌ Batch TTS failed: {result}")
             return False
             
     except Exception as e:
-        print(f"❌ Batch TTS failed: {e}")
+        log(f"❌ Batch TTS failed: {e}")
         return False
 
-def test_stats(api_base):
+async def test_stats(client, log):
     """Test service statistics"""
     try:
-        print("📊 Testing service statistics...")
-        response = requests.get(f"{api_base}/stats", timeout=10)
+        log("📊 Testing service statistics...")
+        response = await client.get("/stats", timeout=10)
         response.raise_for_status()
         stats = response.json()
         
-        print("✅ Service statistics:")
-        print(f"   Audio files: {stats['total_audio_files']}")
-        print(f"   Total size: {stats['total_size_mb']} MB")
-        print(f"   Available voices: {stats['available_voices']}")
-        print(f"   Max text length: {stats['max_text_length']} chars")
-        print(f"   Cleanup interval: {stats['cleanup_interval_hours']} hours")
+        log("✅ Service statistics:")
+        log(f"   Audio files: {stats['total_audio_files']}")
+        log(f"   Total size: {stats['total_size_mb']} MB")
+        log(f"   Available voices: {stats['available_voices']}")
+        log(f"   Max text length: {stats['max_text_length']} chars")
+        log(f"   Cleanup interval: {stats['cleanup_interval_hours']} hours")
         
         return True
     except Exception as e:
-        print(f"❌ Stats test failed: {e}")
+        log(f"❌ Stats test failed: {e}")
         return False
 
+async def run_test(client, test_name, test_func):
+    """Run one test, buffering its output so concurrent tests don't interleave"""
+    lines = [f"🧪 {test_name}"]
+    try:
+        ok = await test_func(client, lambda *args: lines.append(" ".join(str(a) for a in args)))
+    except Exception as e:
+        lines.append(f"❌ {test_name} crashed: {e}")
+        ok = False
+    print("\n".join(lines))
+    print()
+    return ok
+
+async def run_tests(api_base):
+    """Run independent tests concurrently, then the batch test"""
+    async with httpx.AsyncClient(base_url=api_base, timeout=30) as client:
+        results = await asyncio.gather(
+            run_test(client, "Health Check", test_health),
+            run_test(client, "Voice Listing", test_voices),
+            run_test(client, "Indonesian TTS", test_indonesian_tts),
+            run_test(client, "English TTS", test_english_tts),
+            run_test(client, "Service Stats", test_stats)
+        )
+        # Batch runs last so its load does not skew the single-request tests
+        results.append(await run_test(client, "Batch TTS", test_batch_tts))
+    return results
+
 def main():
     print("🎬 ARSA Technology Edge-TTS API Test Suite")
     print("=" * 50)
@@ -215,35 +242,14 @@ def main():
     print(f"📡 Testing API at: {api_base}")
     print()
     
-    # Test suite
-    tests = [
-        ("Health Check", test_health),
-        ("Voice Listing", test_voices),
-        ("Indonesian TTS", test_indonesian_tts),
-        ("English TTS", test_english_tts),
-        ("Batch TTS", test_batch_tts),
-        ("Service Stats", test_stats)
-    ]
-    
-    passed = 0
-    failed = 0
+    try:
+        results = asyncio.run(run_tests(api_base))
+    except KeyboardInterrupt:
+        print("\n⚠️ Test interrupted by user")
+        results = []
     
-    for test_name, test_func in tests:
-        print(f"🧪 {test_name}")
-        try:
-            if test_func(api_base):
-                passed += 1
-            else:
-                failed += 1
-        except KeyboardInterrupt:
-            print("\n⚠️ Test interrupted by user")
-            break
-        except Exception as e:
-            print(f"❌ {test_name} crashed: {e}")
-            failed += 1
-        
-        print()
-        time.sleep(1)  # Brief pause between tests
+    passed = sum(1 for ok in results if ok)
+    failed = len(results) - passed
     
     # Results
     print("=" * 50)